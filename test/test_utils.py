@@ -2120,6 +2120,25 @@ Line 1
         headers5 = HTTPHeaderDict({'ytdl-test': ' data; '})
         self.assertEqual(set(headers5.items()), {('Ytdl-Test', 'data;')})
 
+        # update() must normalize regardless of the source type
+        headers6 = HTTPHeaderDict()
+        headers6.update(HTTPHeaderDict({'ytdl-test': 1}))
+        headers6.update([('x-dlp', 2)])
+        headers6.update({'ytdl-Other': b'3'}, **{'x-kwarg': ' 4 '})
+        self.assertEqual(dict(headers6), {'Ytdl-Test': '1', 'X-Dlp': '2', 'Ytdl-Other': '3', 'X-Kwarg': '4'})
+
+        # union operators must return normalizing HTTPHeaderDicts, preferring the right operand
+        headers7 = HTTPHeaderDict({'ytdl-test': 1}) | {'YTDL-test': b'2', 'x-dlp': 3}
+        self.assertIsInstance(headers7, HTTPHeaderDict)
+        self.assertEqual(dict(headers7), {'Ytdl-Test': '2', 'X-Dlp': '3'})
+        headers8 = {'YTDL-test': 1, 'x-dlp': 2} | HTTPHeaderDict({'ytdl-test': b'3'})
+        self.assertIsInstance(headers8, HTTPHeaderDict)
+        self.assertEqual(dict(headers8), {'Ytdl-Test': '3', 'X-Dlp': '2'})
+        headers9 = HTTPHeaderDict({'ytdl-test': 1})
+        headers9 |= {'YTDL-test': 2, 'x-dlp': b' 3 '}
+        self.assertIsInstance(headers9, HTTPHeaderDict)
+        self.assertEqual(dict(headers9), {'Ytdl-Test': '2', 'X-Dlp': '3'})
+
     def test_extract_basic_auth(self):
         assert extract_basic_auth('http://:foo.bar') == ('http://:foo.bar', None)
         assert extract_basic_auth('http://foo.bar') == ('http://foo.bar', None)
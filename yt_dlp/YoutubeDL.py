@@ -629,7 +629,7 @@ class YoutubeDL:
         self._ies = {}
         self._ies_instances = {}
         self._pps = {k: [] for k in POSTPROCESS_WHEN}
-        self._printed_messages = set()
+        self._printed_messages = collections.OrderedDict()
         self._first_webpage_request = True
         self._post_hooks = []
         self._progress_hooks = []
@@ -701,10 +701,13 @@ class YoutubeDL:
                 width = shutil.get_terminal_size().columns
                 width_args = [] if width is None else ['-w', str(width)]
                 sp_kwargs = {'stdin': subprocess.PIPE, 'stdout': slave, 'stderr': self._out_files.error}
-                try:
+                # Probe PATH instead of spawning a process just to catch ENOENT
+                if shutil.which('bidiv'):
                     self._output_process = Popen(['bidiv', *width_args], **sp_kwargs)
-                except OSError:
+                elif shutil.which('fribidi'):
                     self._output_process = Popen(['fribidi', '-c', 'UTF-8', *width_args], **sp_kwargs)
+                else:
+                    raise OSError(errno.ENOENT, 'Missing fribidi executable')
                 self._output_channel = os.fdopen(master, 'rb')
             except OSError as ose:
                 if ose.errno == errno.ENOENT:
@@ -921,9 +924,14 @@ class YoutubeDL:
 
     def _write_string(self, message, out=None, only_once=False):
         if only_once:
-            if message in self._printed_messages:
+            # Store hashes in a bounded map, so that long sessions don't keep
+            # every distinct message (incl. multi-KB tracebacks) alive forever
+            key = hash(message)
+            if key in self._printed_messages:
                 return
-            self._printed_messages.add(message)
+            self._printed_messages[key] = None
+            if len(self._printed_messages) > 1024:
+                self._printed_messages.popitem(last=False)
         write_string(message, out=out, encoding=self.params.get('encoding'))
 
     def to_stdout(self, message, skip_eol=False, quiet=None):
@@ -1066,6 +1074,20 @@ class YoutubeDL:
     def _format_err(self, *args, **kwargs):
         return self._format_text(self._out_files.error, self._allow_colors.error, *args, **kwargs)
 
+    # The formatted prefixes are constant per instance, so compute them once
+    # instead of re-running _format_err for every emitted message
+    @functools.cached_property
+    def _warning_prefix(self):
+        return self._format_err('WARNING:', self.Styles.WARNING)
+
+    @functools.cached_property
+    def _error_prefix(self):
+        return self._format_err('ERROR:', self.Styles.ERROR)
+
+    @functools.cached_property
+    def _deprecated_prefix(self):
+        return self._format_err('Deprecated Feature:', self.Styles.ERROR)
+
     def report_warning(self, message, only_once=False):
         """
         Print the message to stderr, it will be prefixed with 'WARNING:'
@@ -1076,7 +1098,7 @@ class YoutubeDL:
         else:
             if self.params.get('no_warnings'):
                 return
-            self.to_stderr(f'{self._format_err("WARNING:", self.Styles.WARNING)} {message}', only_once)
+            self.to_stderr(f'{self._warning_prefix} {message}', only_once)
 
     def deprecation_warning(self, message, *, stacklevel=0):
         deprecation_warning(
@@ -1085,14 +1107,14 @@ class YoutubeDL:
     def deprecated_feature(self, message):
         if self.params.get('logger') is not None:
             self.params['logger'].warning(f'Deprecated Feature: {message}')
-        self.to_stderr(f'{self._format_err("Deprecated Feature:", self.Styles.ERROR)} {message}', True)
+        self.to_stderr(f'{self._deprecated_prefix} {message}', True)
 
     def report_error(self, message, *args, **kwargs):
         """
         Do the same as trouble, but prefixes the message with 'ERROR:', colored
         in red if stderr is a tty file.
         """
-        self.trouble(f'{self._format_err("ERROR:", self.Styles.ERROR)} {message}', *args, **kwargs)
+        self.trouble(f'{self._error_prefix} {message}', *args, **kwargs)
 
     def write_debug(self, message, only_once=False):
         """Log debug message or Print message to stderr"""
@@ -23,6 +23,13 @@ else:
         certifi = None
 
 
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
 try:
     import mutagen
 except ImportError:
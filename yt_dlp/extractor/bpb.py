@@ -1,6 +1,8 @@
+import functools
 import re
 
 from .common import InfoExtractor
+from ..dependencies import lxml
 from ..utils import (
     clean_html,
     extract_attributes,
@@ -100,9 +102,18 @@ class BpbIE(InfoExtractor):
     }]
 
     _TITLE_RE = re.compile('(?P<title>[^<]*)<[^>]+>(?P<series>[^<]*)')
+    _FIND_HEADER_TITLE = staticmethod(find_element(cls='opening-header__title'))
+    _FIND_INTRO = staticmethod(find_element(cls='opening-intro'))
+    _FIND_ACCORDION = staticmethod(find_element(tag='bpb-accordion-item'))
+    _FIND_TEXT_CONTENT = staticmethod(find_element(cls='text-content'))
+
+    @staticmethod
+    @functools.lru_cache
+    def _vue_tag_re(name):
+        return re.compile(rf'(<{name}(?:"[^"]*?"|[^>])*>)')
 
     def _parse_vue_attributes(self, name, string, video_id):
-        attributes = extract_attributes(self._search_regex(rf'(<{name}(?:"[^"]*?"|[^>])*>)', string, name))
+        attributes = extract_attributes(self._search_regex(self._vue_tag_re(name), string, name))
 
         for key, value in attributes.items():
             if key.startswith(':'):
@@ -130,22 +141,46 @@ class BpbIE(InfoExtractor):
             'format_id': join_nonempty(extension, note),
         }
 
+    def _extract_title_and_description(self, webpage):
+        # lxml parses the page once in C; the fallback helpers scan the raw HTML per element
+        if lxml:
+            try:
+                root = lxml.html.fromstring(webpage)
+            except (lxml.etree.LxmlError, ValueError):
+                # e.g. ValueError for pages carrying an XML encoding declaration
+                root = None
+            if root is not None:
+                header = next(iter(root.find_class('opening-header__title')), None)
+                header_html = header is not None and (header.text or '') + ''.join(
+                    lxml.etree.tostring(child, encoding='unicode') for child in header)
+                parts = list(root.find_class('opening-intro')[:1])
+                accordion = root.find('.//bpb-accordion-item')
+                if accordion is not None:
+                    parts.extend(accordion.find_class('text-content')[:1])
+                return self._TITLE_RE.match(header_html) if header_html else None, join_nonempty(
+                    *(clean_html(lxml.etree.tostring(el, encoding='unicode', with_tail=False)) for el in parts),
+                    delim='\n\n') or None
+
+        header = self._FIND_HEADER_TITLE(webpage)
+        return self._TITLE_RE.match(header) if header else None, join_nonempty(
+            *traverse_obj(webpage, [(
+                {self._FIND_INTRO},
+                [{self._FIND_ACCORDION}, {self._FIND_TEXT_CONTENT}],
+            ), {clean_html}]), delim='\n\n') or None
+
     def _real_extract(self, url):
         video_id = self._match_id(url)
         webpage = self._download_webpage(url, video_id)
 
-        title_result = traverse_obj(webpage, ({find_element(cls='opening-header__title')}, {self._TITLE_RE.match}))
+        title_match, description = self._extract_title_and_description(webpage)
         json_lds = list(self._yield_json_ld(webpage, video_id, fatal=False))
 
         return {
             'id': video_id,
-            'title': traverse_obj(title_result, ('title', {str.strip})) or None,
+            'title': (title_match['title'].strip() or None) if title_match else None,
             # This metadata could be interpreted otherwise, but it fits "series" the most
-            'series': traverse_obj(title_result, ('series', {str.strip})) or None,
-            'description': join_nonempty(*traverse_obj(webpage, [(
-                {find_element(cls='opening-intro')},
-                [{find_element(tag='bpb-accordion-item')}, {find_element(cls='text-content')}],
-            ), {clean_html}]), delim='\n\n') or None,
+            'series': (title_match['series'].strip() or None) if title_match else None,
+            'description': description,
             'creators': traverse_obj(self._html_search_meta('author', webpage), all),
             'uploader': self._html_search_meta('publisher', webpage),
             'release_date': unified_strdate(self._html_search_meta('date', webpage)),
@@ -1,3 +1,6 @@
+import functools
+import re
+
 from .common import InfoExtractor
 from ..utils import (
     ExtractorError,
@@ -5,6 +8,7 @@ from ..utils import (
     extract_attributes,
     get_element_by_class,
     get_element_html_by_class,
+    int_or_none,
     multipart_encode,
     str_or_none,
     unified_timestamp,
@@ -12,6 +16,9 @@ from ..utils import (
 )
 from ..utils.traversal import traverse_obj
 
+_START_INFO_RE = re.compile(r'(?P<date>\d{4}/\d{1,2}/\d{1,2})\([月火水木金土日]\)(?P<time>\d{2}:\d{2})')
+_PAGE_VARIABLE_RE = re.compile(r'(?:var|const|let)\s+(programCode|articleCode)\s*=\s*(["\'])((?:(?!\2).)+)\2')
+
 
 class PiaLiveIE(InfoExtractor):
     _VALID_URL = r'https?://player\.pia-live\.jp/stream/(?P<id>[\w-]+)'
@@ -50,17 +57,22 @@ class PiaLiveIE(InfoExtractor):
         'skip': 'The video is no longer available',
     }]
 
+    @staticmethod
+    @functools.lru_cache
+    def _variable_re(variable):
+        return re.compile(rf'(?:var|const|let)\s+{variable}\s*=\s*(["\'])(?P<value>(?:(?!\1).)+)\1')
+
     def _extract_var(self, variable, html):
         return self._search_regex(
-            rf'(?:var|const|let)\s+{variable}\s*=\s*(["\'])(?P<value>(?:(?!\1).)+)\1',
-            html, f'variable {variable}', group='value')
+            self._variable_re(variable), html, f'variable {variable}', group='value')
 
     def _real_extract(self, url):
         video_key = self._match_id(url)
         webpage = self._download_webpage(url, video_key)
 
-        program_code = self._extract_var('programCode', webpage)
-        article_code = self._extract_var('articleCode', webpage)
+        page_variables = {m.group(1): m.group(3) for m in _PAGE_VARIABLE_RE.finditer(webpage)}
+        program_code = page_variables.get('programCode') or self._extract_var('programCode', webpage)
+        article_code = page_variables.get('articleCode') or self._extract_var('articleCode', webpage)
         title = self._html_extract_title(webpage)
 
         if get_element_html_by_class('play-end', webpage):
@@ -68,8 +80,7 @@ class PiaLiveIE(InfoExtractor):
 
         if start_info := clean_html(get_element_by_class('play-waiting__date', webpage)):
             date, time = self._search_regex(
-                r'(?P<date>\d{4}/\d{1,2}/\d{1,2})\([月火水木金土日]\)(?P<time>\d{2}:\d{2})',
-                start_info, 'start_info', fatal=False, group=('date', 'time'))
+                _START_INFO_RE, start_info, 'start_info', fatal=False, group=('date', 'time'))
             if date and time:
                 release_timestamp_str = f'{date} {time} +09:00'
                 release_timestamp = unified_timestamp(release_timestamp_str)
@@ -111,12 +122,17 @@ class PiaLiveIE(InfoExtractor):
             fatal=False, headers={'Referer': self._PLAYER_ROOT_URL})
         if not comment_page:
             return
-        yield from traverse_obj(self._search_json(
-            r'var\s+_history\s*=', comment_page, 'comment list',
-            program_code, contains_pattern=r'\[(?s:.+)\]', fatal=False), (..., {
-                'timestamp': (0, {int}),
-                'author_is_uploader': (1, {lambda x: x == 2}),
-                'author': (2, {str}),
-                'text': (3, {str}),
-                'id': (4, {str_or_none}),
-            }))
+        # A plain loop is much cheaper than a traverse_obj spec when comment
+        # lists run into the thousands
+        for comment in self._search_json(
+                r'var\s+_history\s*=', comment_page, 'comment list',
+                program_code, contains_pattern=r'\[(?s:.+)\]', fatal=False) or []:
+            if not isinstance(comment, list) or len(comment) < 5:
+                continue
+            yield {
+                'timestamp': int_or_none(comment[0]),
+                'author_is_uploader': comment[1] == 2,
+                'author': str_or_none(comment[2]),
+                'text': str_or_none(comment[3]),
+                'id': str_or_none(comment[4]),
+            }
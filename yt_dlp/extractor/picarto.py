@@ -23,16 +23,7 @@ class PicartoIE(InfoExtractor):
         'skip': 'Stream is offline',
     }
 
-    @classmethod
-    def suitable(cls, url):
-        return False if PicartoVodIE.suitable(url) else super().suitable(url)
-
-    def _real_extract(self, url):
-        channel_id = self._match_id(url)
-
-        data = self._download_json(
-            'https://ptvintern.picarto.tv/ptvapi', channel_id, query={
-                'query': '''{
+    _CHANNEL_QUERY = '''{
   channel(name: "%s") {
     adult
     id
@@ -43,7 +34,18 @@ class PicartoIE(InfoExtractor):
   getLoadBalancerUrl(channel_name: "%s") {
     url
   }
-}''' % (channel_id, channel_id),  # noqa: UP031
+}'''
+
+    @classmethod
+    def suitable(cls, url):
+        return False if PicartoVodIE.suitable(url) else super().suitable(url)
+
+    def _real_extract(self, url):
+        channel_id = self._match_id(url)
+
+        data = self._download_json(
+            'https://ptvintern.picarto.tv/ptvapi', channel_id, query={
+                'query': self._CHANNEL_QUERY % (channel_id, channel_id),  # noqa: UP031
             }, headers={'Accept': '*/*', 'Content-Type': 'application/json'})['data']
         metadata = data['channel']
 
@@ -57,10 +59,12 @@ class PicartoIE(InfoExtractor):
             channel_id, 'Downloading load balancing info')
 
         formats = []
-        for source in (cdn_data.get('source') or []):
+        seen_urls = set()
+        for source in cdn_data.get('source') or ():
             source_url = source.get('url')
-            if not source_url:
+            if not source_url or source_url in seen_urls:
                 continue
+            seen_urls.add(source_url)
             source_type = source.get('type')
             if source_type == 'html5/application/vnd.apple.mpegurl':
                 formats.extend(self._extract_m3u8_formats(
@@ -116,27 +120,29 @@ class PicartoVodIE(InfoExtractor):
         'only_matching': True,
     }]
 
-    def _real_extract(self, url):
-        video_id = self._match_id(url)
-
-        data = self._download_json(
-            'https://ptvintern.picarto.tv/ptvapi', video_id, query={
-                'query': f'''{{
-  video(id: "{video_id}") {{
+    _VOD_QUERY = '''{
+  video(id: "%s") {
     id
     title
     adult
     file_name
     video_recording_image_url
-    channel {{
+    channel {
       name
-    }}
-  }}
-}}''',
+    }
+  }
+}'''
+
+    def _real_extract(self, url):
+        video_id = self._match_id(url)
+
+        data = self._download_json(
+            'https://ptvintern.picarto.tv/ptvapi', video_id, query={
+                'query': self._VOD_QUERY % video_id,  # noqa: UP031
             }, headers={'Accept': '*/*', 'Content-Type': 'application/json'})['data']['video']
 
         file_name = data['file_name']
-        netloc = urllib.parse.urlparse(data['video_recording_image_url']).netloc
+        netloc = urllib.parse.urlsplit(data['video_recording_image_url']).netloc
 
         formats = self._extract_m3u8_formats(
             f'https://{netloc}/stream/hls/{file_name}/index.m3u8', video_id, 'mp4', m3u8_id='hls')
@@ -1,4 +1,5 @@
 import itertools
+import re
 
 from .common import InfoExtractor
 from ..networking.exceptions import HTTPError
@@ -13,6 +14,12 @@ from ..utils import (
     url_or_none,
 )
 
+_PLAYER_TRACK_RE = re.compile(r'<div[^>]+id=["\']player-track')
+_TITLE_RE = re.compile(r'<h3>(.+?)</h3>\s*<p[^>]*>.*?</p>\s*$')
+_DESCRIPTION_RE = re.compile(r'<p[^>]+title=(["\'])(?P<url>(?:(?!\1).)+)\1[^>]*>.*?</p>\s*$')
+_DURATION_RE = re.compile(r'data-duration=["\'](\d+)')
+_PLAYER_RE = re.compile(r'(<div class="mujRozhlasPlayer" data-player=\'[^\']+\'>)')
+
 
 class RozhlasIE(InfoExtractor):
     _VALID_URL = r'https?://(?:www\.)?prehravac\.rozhlas\.cz/audio/(?P<id>[0-9]+)'
@@ -36,15 +43,19 @@ class RozhlasIE(InfoExtractor):
         webpage = self._download_webpage(
             f'http://prehravac.rozhlas.cz/audio/{audio_id}', audio_id)
 
+        # Locate the player div first and only scan the window before it;
+        # running the lazy title/description patterns over the whole page
+        # backtracks quadratically when the anchor is missing
+        anchor = _PLAYER_TRACK_RE.search(webpage)
+        window = webpage[max(0, anchor.start() - 2048):anchor.start()] if anchor else ''
+
         title = self._html_search_regex(
-            r'<h3>(.+?)</h3>\s*<p[^>]*>.*?</p>\s*<div[^>]+id=["\']player-track',
-            webpage, 'title', default=None) or remove_start(
+            _TITLE_RE, window, 'title', default=None) or remove_start(
             self._og_search_title(webpage), 'Radio Wave - ')
         description = self._html_search_regex(
-            r'<p[^>]+title=(["\'])(?P<url>(?:(?!\1).)+)\1[^>]*>.*?</p>\s*<div[^>]+id=["\']player-track',
-            webpage, 'description', fatal=False, group='url')
+            _DESCRIPTION_RE, window, 'description', fatal=False, group='url')
         duration = int_or_none(self._search_regex(
-            r'data-duration=["\'](\d+)', webpage, 'duration', default=None))
+            _DURATION_RE, webpage, 'duration', default=None))
 
         return {
             'id': audio_id,
@@ -206,21 +217,22 @@ class RozhlasVltavaIE(RozhlasBaseIE):
     }]
 
     def _extract_video(self, entry):
-        audio_id = entry['meta']['ga']['contentId']
-        chapter_number = traverse_obj(entry, ('meta', 'ga', 'contentSerialPart', {int_or_none}))
+        # All the metadata lives in flat keys of meta.ga, so walk it once
+        # instead of re-traversing the nested dict per field
+        ga = entry['meta']['ga']
+        audio_id = ga['contentId']
+        chapter_number = int_or_none(ga.get('contentSerialPart'))
 
         return {
             'id': audio_id,
-            'chapter': traverse_obj(entry, ('meta', 'ga', 'contentNameShort')) if chapter_number else None,
+            'chapter': ga.get('contentNameShort') if chapter_number else None,
             'chapter_number': chapter_number,
             'formats': self._extract_formats(entry, audio_id),
-            **traverse_obj(entry, {
-                'title': ('meta', 'ga', 'contentName'),
-                'description': 'title',
-                'duration': ('duration', {int_or_none}),
-                'artist': ('meta', 'ga', 'contentAuthor'),
-                'channel_id': ('meta', 'ga', 'contentCreator'),
-            }),
+            'title': ga.get('contentName'),
+            'description': entry.get('title'),
+            'duration': int_or_none(entry.get('duration')),
+            'artist': ga.get('contentAuthor'),
+            'channel_id': ga.get('contentCreator'),
         }
 
     def _real_extract(self, url):
@@ -229,8 +241,7 @@ class RozhlasVltavaIE(RozhlasBaseIE):
 
         # FIXME: Use get_element_text_and_html_by_tag when it accepts less strict html
         data = self._parse_json(extract_attributes(self._search_regex(
-            r'(<div class="mujRozhlasPlayer" data-player=\'[^\']+\'>)',
-            webpage, 'player'))['data-player'], video_id)['data']
+            _PLAYER_RE, webpage, 'player'))['data-player'], video_id)['data']
 
         return {
             '_type': 'playlist',
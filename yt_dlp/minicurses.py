@@ -30,12 +30,9 @@ _TEXT_STYLES = {
 }
 
 
-def format_text(text, f):
-    '''
-    @param f    String representation of formatting to apply in the form:
-                [style] [light] font_color [on [light] bg_color]
-                E.g. "red", "bold green on light blue"
-    '''
+@functools.lru_cache
+def _parse_format_spec(f):
+    """Resolve a format spec into its constant (fg_color, bg_color) escape sequences"""
     f = f.upper()
     tokens = f.strip().split()
 
@@ -68,6 +65,16 @@ def format_text(text, f):
         if tokens:
             raise SyntaxError(f'Invalid format {" ".join(tokens)!r} in {f!r}')
 
+    return fg_color, bg_color
+
+
+def format_text(text, f):
+    '''
+    @param f    String representation of formatting to apply in the form:
+                [style] [light] font_color [on [light] bg_color]
+                E.g. "red", "bold green on light blue"
+    '''
+    fg_color, bg_color = _parse_format_spec(f)
     if fg_color or bg_color:
         text = text.replace(CONTROL_SEQUENCES['RESET'], f'{fg_color}{bg_color}')
         return f'{fg_color}{bg_color}{text}{CONTROL_SEQUENCES["RESET"]}'
@@ -1,60 +1,95 @@
-import collections
 import random
+import sys
 import urllib.parse
 import urllib.request
 
 from ._utils import remove_start
 
 
+_USER_AGENT_TPL = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/%s Safari/537.36'
+_CHROME_VERSIONS = (
+    '90.0.4430.212',
+    '90.0.4430.24',
+    '90.0.4430.70',
+    '90.0.4430.72',
+    '90.0.4430.85',
+    '90.0.4430.93',
+    '91.0.4472.101',
+    '91.0.4472.106',
+    '91.0.4472.114',
+    '91.0.4472.124',
+    '91.0.4472.164',
+    '91.0.4472.19',
+    '91.0.4472.77',
+    '92.0.4515.107',
+    '92.0.4515.115',
+    '92.0.4515.131',
+    '92.0.4515.159',
+    '92.0.4515.43',
+    '93.0.4556.0',
+    '93.0.4577.15',
+    '93.0.4577.63',
+    '93.0.4577.82',
+    '94.0.4606.41',
+    '94.0.4606.54',
+    '94.0.4606.61',
+    '94.0.4606.71',
+    '94.0.4606.81',
+    '94.0.4606.85',
+    '95.0.4638.17',
+    '95.0.4638.50',
+    '95.0.4638.54',
+    '95.0.4638.69',
+    '95.0.4638.74',
+    '96.0.4664.18',
+    '96.0.4664.45',
+    '96.0.4664.55',
+    '96.0.4664.93',
+    '97.0.4692.20',
+)
+_USER_AGENTS = tuple(_USER_AGENT_TPL % version for version in _CHROME_VERSIONS)
+
+
 def random_user_agent():
-    _USER_AGENT_TPL = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/%s Safari/537.36'
-    _CHROME_VERSIONS = (
-        '90.0.4430.212',
-        '90.0.4430.24',
-        '90.0.4430.70',
-        '90.0.4430.72',
-        '90.0.4430.85',
-        '90.0.4430.93',
-        '91.0.4472.101',
-        '91.0.4472.106',
-        '91.0.4472.114',
-        '91.0.4472.124',
-        '91.0.4472.164',
-        '91.0.4472.19',
-        '91.0.4472.77',
-        '92.0.4515.107',
-        '92.0.4515.115',
-        '92.0.4515.131',
-        '92.0.4515.159',
-        '92.0.4515.43',
-        '93.0.4556.0',
-        '93.0.4577.15',
-        '93.0.4577.63',
-        '93.0.4577.82',
-        '94.0.4606.41',
-        '94.0.4606.54',
-        '94.0.4606.61',
-        '94.0.4606.71',
-        '94.0.4606.81',
-        '94.0.4606.85',
-        '95.0.4638.17',
-        '95.0.4638.50',
-        '95.0.4638.54',
-        '95.0.4638.69',
-        '95.0.4638.74',
-        '96.0.4664.18',
-        '96.0.4664.45',
-        '96.0.4664.55',
-        '96.0.4664.93',
-        '97.0.4692.20',
-    )
-    return _USER_AGENT_TPL % random.choice(_CHROME_VERSIONS)
-
-
-class HTTPHeaderDict(collections.UserDict, dict):
+    return random.choice(_USER_AGENTS)
+
+
+_TITLE_CACHE = {}
+# Canonical forms of the most frequently stored header names; interning them
+# makes the dict lookups on these keys pointer comparisons
+_COMMON_HEADER_NAMES = frozenset(map(sys.intern, (
+    'Accept', 'Accept-Encoding', 'Accept-Language', 'Authorization', 'Content-Length',
+    'Content-Type', 'Cookie', 'Referer', 'Sec-Fetch-Mode', 'User-Agent',
+)))
+
+
+def _titled(key):
+    """Memoized `str.title()` for header names
+
+    The same handful of constant names is normalized on nearly every header
+    access, so a dict hit is cheaper than re-running the case transformation.
+    The cache is cleared when it grows too large, since header names can come
+    from untrusted input.
+    """
+    titled = _TITLE_CACHE.get(key)
+    if titled is None:
+        if len(_TITLE_CACHE) > 4096:
+            _TITLE_CACHE.clear()
+        titled = key.title()
+        if titled in _COMMON_HEADER_NAMES:
+            titled = sys.intern(titled)
+        _TITLE_CACHE[key] = titled
+    return titled
+
+
+class HTTPHeaderDict(dict):
     """
     Store and access keys case-insensitively.
     The constructor can take multiple dicts, in which keys in the latter are prioritised.
+
+    Subclasses `dict` directly (not `collections.UserDict`) so that reads and
+    writes on this hot networking path avoid the `UserDict.data` indirection;
+    the mutating/lookup methods are overridden to keep case-normalization.
     """
 
     def __init__(self, *args, **kwargs):
@@ -62,21 +97,68 @@ class HTTPHeaderDict(collections.UserDict, dict):
         for dct in args:
             if dct is not None:
                 self.update(dct)
-        self.update(kwargs)
+        if kwargs:
+            self.update(kwargs)
 
     def __setitem__(self, key, value):
         if isinstance(value, bytes):
             value = value.decode('latin-1')
-        super().__setitem__(key.title(), str(value).strip())
+        super().__setitem__(_titled(key), str(value).strip())
 
     def __getitem__(self, key):
-        return super().__getitem__(key.title())
+        return super().__getitem__(_titled(key))
 
     def __delitem__(self, key):
-        super().__delitem__(key.title())
+        super().__delitem__(_titled(key))
 
     def __contains__(self, key):
-        return super().__contains__(key.title() if isinstance(key, str) else key)
+        return super().__contains__(_titled(key) if isinstance(key, str) else key)
+
+    def update(self, other=(), **kwargs):
+        # dict.update does not call __setitem__, so route everything through it
+        if type(other) is HTTPHeaderDict:
+            # Keys and values of another HTTPHeaderDict are already normalized
+            super().update(other)
+        elif hasattr(other, 'keys'):
+            for key in other.keys():  # noqa: SIM118
+                self[key] = other[key]
+        else:
+            for key, value in other:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def get(self, key, default=None):
+        return super().get(_titled(key) if isinstance(key, str) else key, default)
+
+    def pop(self, key, *args):
+        return super().pop(_titled(key) if isinstance(key, str) else key, *args)
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def copy(self):
+        return type(self)(self)
+
+    # dict's operator implementations return plain dicts with raw keys/values,
+    # so route them through the normalizing constructor/update as well
+    def __or__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return type(self)(self, other)
+
+    def __ror__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return type(self)(other, self)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
 
 
 std_headers = HTTPHeaderDict({
@@ -87,7 +169,14 @@ std_headers = HTTPHeaderDict({
 })
 
 
+# Schemes that clean_proxies would pass through unchanged; URLs already
+# carrying one can skip the _parse_proxy/urlparse work entirely
+_NORMALIZED_PROXY_SCHEMES = ('http://', 'https://', 'socks4://', 'socks4a://', 'socks5h://')
+
+
 def clean_proxies(proxies: dict, headers: HTTPHeaderDict):
+    if not proxies and 'Ytdl-Request-Proxy' not in headers:
+        return
     req_proxy = headers.pop('Ytdl-Request-Proxy', None)
     if req_proxy:
         proxies.clear()  # XXX: compat: Ytdl-Request-Proxy takes preference over everything, including NO_PROXY
@@ -99,6 +188,8 @@ def clean_proxies(proxies: dict, headers: HTTPHeaderDict):
         if proxy_key == 'no':  # special case
             continue
         if proxy_url is not None:
+            if proxy_url.startswith(_NORMALIZED_PROXY_SCHEMES):
+                continue
             # Ensure proxies without a scheme are http.
             try:
                 proxy_scheme = urllib.request._parse_proxy(proxy_url)[0]
@@ -115,8 +206,12 @@ def clean_proxies(proxies: dict, headers: HTTPHeaderDict):
                 'socks': 'socks4',  # compat: non-standard
             }
             if proxy_scheme in replace_scheme:
-                proxies[proxy_key] = urllib.parse.urlunparse(
-                    urllib.parse.urlparse(proxy_url)._replace(scheme=replace_scheme[proxy_scheme]))
+                if proxy_url.startswith(f'{proxy_scheme}:'):
+                    # Swap the scheme textually instead of a parse/unparse round trip
+                    proxies[proxy_key] = replace_scheme[proxy_scheme] + proxy_url[len(proxy_scheme):]
+                else:
+                    proxies[proxy_key] = urllib.parse.urlunparse(
+                        urllib.parse.urlparse(proxy_url)._replace(scheme=replace_scheme[proxy_scheme]))
 
 
 def clean_headers(headers: HTTPHeaderDict):